@@ -0,0 +1,16 @@
+import pandas as pd
+
+# One-off preprocessing: convert the raw CSV exports into Parquet files so the
+# dashboard reads typed, columnar data instead of re-parsing CSV on every cold start.
+# Re-run this whenever the CSVs are updated.
+DATASETS = ["influencers", "tracking_data", "payouts"]
+DATE_COLUMNS = ["date", "campaign_date"]
+
+if __name__ == "__main__":
+    for name in DATASETS:
+        df = pd.read_csv(f"{name}.csv")
+        for col in DATE_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors="coerce")
+        df.to_parquet(f"{name}.parquet", engine="pyarrow", compression="zstd", index=False)
+        print(f"✅ {name}.csv -> {name}.parquet ({len(df)} rows)")
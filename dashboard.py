@@ -2,8 +2,16 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime
 import numpy as np
+import os
+import pyarrow.parquet as pq
+
+# Shared chart styling, applied to every Plotly Express figure
+pio.templates.default = "plotly_white"
+px.defaults.template = "plotly_white"
+px.defaults.height = 400
 
 # Page configuration
 st.set_page_config(
@@ -13,26 +21,303 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load CSV files with error handling
-@st.cache_data
+# Columns consumed downstream; everything else is skipped at read time
+INFLUENCER_COLUMNS = [
+    "influencer_id", "username", "name", "platform",
+    "category", "follower_count", "engagement_rate"
+]
+TRACKING_COLUMNS = ["influencer_id", "date", "campaign_date", "orders", "revenue"]
+
+# Read a dataset from its Parquet copy (see convert_to_parquet.py) if present, else from CSV.
+# A CSV edited after the last conversion wins, so a stale Parquet copy is never served.
+def read_table(name, columns=None):
+    parquet_path = f"{name}.parquet"
+    csv_path = f"{name}.csv"
+    parquet_fresh = os.path.exists(parquet_path) and (
+        not os.path.exists(csv_path)
+        or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+    )
+    if parquet_fresh:
+        if columns is not None:
+            available = pq.read_schema(parquet_path).names
+            columns = [c for c in columns if c in available]
+        return pd.read_parquet(parquet_path, engine="pyarrow", columns=columns)
+    usecols = None if columns is None else (lambda c: c in columns)
+    return pd.read_csv(csv_path, usecols=usecols)
+
+# Influencer ids as strings. Numeric ids go through nullable Int64 first: a
+# column with a missing id is read as float, and 1.0 must still match 1
+def normalize_ids(ids):
+    numeric = pd.to_numeric(ids, errors="coerce")
+    if numeric.notna().sum() == ids.notna().sum() and (numeric.dropna() % 1 == 0).all():
+        ids = numeric.astype("Int64")
+    return ids.astype("string")
+
+# Categoricalize low-cardinality labels, store free-text names as Arrow
+# strings and downcast numerics, in place
+def shrink_dtypes(influencers, tracking, payouts):
+    # Bring every frame's influencer_id to one string form, then give them all the
+    # same categorical dtype so joins and groupbys on it compare integer codes
+    id_frames = [df for df in (influencers, tracking, payouts) if "influencer_id" in df.columns]
+    for df in id_frames:
+        df["influencer_id"] = normalize_ids(df["influencer_id"])
+    id_dtype = pd.CategoricalDtype(
+        pd.concat([df["influencer_id"] for df in id_frames]).dropna().unique()
+    )
+    for df in id_frames:
+        df["influencer_id"] = df["influencer_id"].astype(id_dtype)
+    for col in ("username", "name"):
+        if col in influencers.columns:
+            influencers[col] = influencers[col].astype("string[pyarrow]")
+    for col in ("platform", "category"):
+        if col in influencers.columns:
+            influencers[col] = influencers[col].astype("category")
+    if "status" in payouts.columns:
+        payouts["status"] = payouts["status"].astype("category")
+    if "follower_count" in influencers.columns:
+        influencers["follower_count"] = pd.to_numeric(influencers["follower_count"], downcast="unsigned")
+    if "orders" in tracking.columns:
+        tracking["orders"] = pd.to_numeric(tracking["orders"], downcast="unsigned")
+    if "revenue" in tracking.columns:
+        # Revenue is money: only narrow it to a smaller integer type, which is exact.
+        # Fractional revenue stays float64; float32 would skew the totals
+        tracking["revenue"] = pd.to_numeric(tracking["revenue"], downcast="integer")
+
+# Distinct values of a categoricalized column, as a tuple for the sidebar multiselects
+def filter_options(df, col):
+    if col not in df.columns:
+        return ()
+    return tuple(df[col].cat.categories.tolist())
+
+# Load data files with error handling
+# cache_resource hands back the same frames on every rerun instead of
+# copying/rehashing them; treat them as read-only
+@st.cache_resource
 def load_data():
     try:
-        influencers = pd.read_csv("influencers.csv")
-        posts = pd.read_csv("posts.csv")
-        tracking = pd.read_csv("tracking_data.csv")
-        payouts = pd.read_csv("payouts.csv")
-        return influencers, posts, tracking, payouts, None
+        # posts is not loaded: no post metrics feed the dashboard yet
+        influencers = read_table("influencers", INFLUENCER_COLUMNS)
+        tracking = read_table("tracking_data", TRACKING_COLUMNS)
+        payouts = read_table("payouts")
+        shrink_dtypes(influencers, tracking, payouts)
+        
+        # Parse the tracking date column once here instead of on every rerun
+        date_col = next((c for c in ("date", "campaign_date") if c in tracking.columns), None)
+        if date_col:
+            tracking[date_col] = pd.to_datetime(tracking[date_col], errors="coerce", format="ISO8601")
+        
+        # Sidebar filter options; categories are already deduplicated and NaN-free
+        platform_opts = filter_options(influencers, "platform")
+        category_opts = filter_options(influencers, "category")
+        return influencers, tracking, payouts, date_col, platform_opts, category_opts, None
     except FileNotFoundError as e:
-        return None, None, None, None, f"File not found: {e.filename}"
+        return None, None, None, None, None, None, f"File not found: {e.filename}"
     except Exception as e:
-        return None, None, None, None, f"Error loading data: {str(e)}"
+        return None, None, None, None, None, None, f"Error loading data: {str(e)}"
+
+# Column used to label influencers in charts and tables
+def get_name_col(df):
+    if "username" in df.columns:
+        return "username"
+    if "name" in df.columns:
+        return "name"
+    return None
+
+# Influencers indexed by id, built once so name lookups reuse the index hash
+@st.cache_resource
+def influencers_by_id():
+    return load_data()[0].set_index("influencer_id", drop=False)
+
+# Rows of a categorical series whose value is in `selected`, compared on the
+# integer category codes rather than by hashing strings
+def cat_mask(series, selected):
+    codes = series.cat.codes.to_numpy()
+    wanted = series.cat.categories.get_indexer(list(selected))
+    # get_indexer gives -1 for unknown values, which is also the code for NaN
+    return np.isin(codes, wanted[wanted >= 0])
+
+# Influencers matching the sidebar platform/category selections
+@st.cache_data
+def filter_influencers(platforms, categories):
+    influencers = load_data()[0]
+    
+    # Combine both filters into one mask and index once, without copying the frame first
+    mask = np.ones(len(influencers), dtype=bool)
+    
+    if platforms and "platform" in influencers.columns:
+        mask &= cat_mask(influencers["platform"], platforms)
+    
+    if categories and "category" in influencers.columns:
+        mask &= cat_mask(influencers["category"], categories)
+    return influencers[mask]
+
+# Tracking rows within the selected date range (both ends inclusive). The full
+# table is returned until a complete start/end range has been picked, and when
+# the range covers every parsed date, so rows with unparseable dates still count.
+def filter_tracking_dates(tracking, date_col, dates):
+    if not date_col or len(dates) != 2:
+        return tracking
+    lo = np.datetime64(dates[0])
+    hi = np.datetime64(dates[1]) + np.timedelta64(1, "D")
+    if lo <= tracking[date_col].min() and tracking[date_col].max() < hi:
+        return tracking
+    # Compare on the raw datetime64 buffer rather than through pandas
+    values = tracking[date_col].to_numpy()
+    return tracking[(values >= lo) & (values < hi)]
+
+# Per-influencer revenue, orders, cost and ROAS from a single groupby over the
+# tracking rows of the filtered influencers; both summaries below derive from it
+@st.cache_data
+def compute_base_summary(platforms, categories, dates):
+    influencers, tracking, _, date_col, _, _, _ = load_data()
+    tracking = filter_tracking_dates(tracking, date_col, dates)
+    ids = filter_influencers(platforms, categories)["influencer_id"].to_numpy()
+    
+    base = tracking[cat_mask(tracking["influencer_id"], ids)].groupby(
+        "influencer_id", observed=True, sort=False
+    ).agg(
+        revenue=("revenue", "sum"),
+        orders=("orders", "sum")
+    ).reset_index()
+    
+    # orders is downcast on load; widen before scaling so the cost cannot overflow
+    revenue = base["revenue"].to_numpy(dtype=np.float64)
+    cost = base["orders"].to_numpy(dtype=np.float64) * 100  # Assuming cost per order is 100
+    
+    # Avoid division by zero: divide straight into a zeroed buffer, skipping zero-cost rows
+    roas = np.zeros_like(revenue)
+    np.divide(revenue, cost, out=roas, where=cost > 0)
+    base["cost"] = cost
+    base["ROAS"] = roas
+    
+    # Merge with influencer names
+    name_col = get_name_col(influencers)
+    if name_col:
+        base = base.merge(
+            influencers_by_id()[[name_col]], 
+            left_on="influencer_id",
+            right_index=True,
+            how="left",
+            validate="1:1"
+        )
+    return base
+
+# Per-influencer ROAS, revenue and orders
+@st.cache_data
+def compute_roas_summary(platforms, categories, dates):
+    base = compute_base_summary(platforms, categories, dates)
+    name_cols = [c for c in ("username", "name") if c in base.columns]
+    roas_summary = base[["influencer_id", "ROAS", "revenue", "orders", *name_cols]]
+    return roas_summary
+
+# Per-influencer revenue and orders
+@st.cache_data
+def compute_campaign_summary(platforms, categories, dates):
+    base = compute_base_summary(platforms, categories, dates)
+    name_cols = [c for c in ("username", "name") if c in base.columns]
+    campaign_summary = base[["influencer_id", "orders", "revenue", *name_cols]]
+    return campaign_summary
+
+# Markdown for one top-influencer card
+def influencer_card_md(influencer):
+    lines = [
+        f"### {influencer.display}",
+        f"**Platform:** {getattr(influencer, 'platform', 'N/A')} · "
+        f"**Category:** {getattr(influencer, 'category', 'N/A')}",
+        f"**Followers:** {influencer.follower_count:,}",
+    ]
+    if hasattr(influencer, 'engagement_rate'):
+        lines[-1] += f" · **Engagement:** {influencer.engagement_rate:.2%}"
+    return "  \n".join(lines)
+
+# Chart builders return the figure JSON so the cache can hold it; unchanged
+# inputs skip Plotly Express figure construction on reruns
+@st.cache_data
+def build_roas_fig(df, label_col):
+    return px.bar(
+        df,
+        y=label_col,
+        x="ROAS",
+        title="Top 10 Influencers by ROAS",
+        orientation="h"
+    ).to_json()
+
+@st.cache_data
+def build_revenue_fig(df, label_col):
+    return px.pie(
+        df,
+        values="revenue",
+        names=label_col,
+        title="Revenue Distribution (Top 10)"
+    ).to_json()
+
+@st.cache_data
+def build_orders_fig(df, label_col):
+    fig = px.bar(
+        df,
+        x=label_col,
+        y="orders",
+        title="Orders by Influencer (Top 10)"
+    )
+    fig.update_xaxes(tickangle=45)
+    return fig.to_json()
+
+@st.cache_data
+def build_status_fig(status_counts):
+    return px.pie(
+        values=status_counts.values,
+        names=status_counts.index,
+        title="Payout Status Distribution"
+    ).to_json()
+
+# CSV encoding for downloads, cached per distinct frame so reruns skip it
+@st.cache_data
+def to_csv_bytes(df):
+    return df.to_csv(index=False).encode("utf-8")
+
+# Download buttons; as a fragment, clicking one reruns only this section
+# instead of the whole dashboard. The summaries come back in group order, so
+# they are sorted here to export best performers first
+@st.fragment
+def render_export(roas_summary, campaign_summary, payouts):
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if roas_summary is not None and not roas_summary.empty:
+            csv_roas = to_csv_bytes(roas_summary.sort_values(by="ROAS", ascending=False))
+            st.download_button(
+                "📊 Download ROAS Summary",
+                csv_roas,
+                "roas_summary.csv",
+                "text/csv"
+            )
+    
+    with col2:
+        if not payouts.empty:
+            csv_payouts = to_csv_bytes(payouts)
+            st.download_button(
+                "💰 Download Payouts",
+                csv_payouts,
+                "payouts.csv",
+                "text/csv"
+            )
+    
+    with col3:
+        if campaign_summary is not None and not campaign_summary.empty:
+            csv_campaign = to_csv_bytes(campaign_summary.sort_values(by="revenue", ascending=False))
+            st.download_button(
+                "📦 Download Campaign Summary",
+                csv_campaign,
+                "campaign_summary.csv",
+                "text/csv"
+            )
 
 # Load data
-influencers, posts, tracking, payouts, error = load_data()
+influencers, tracking, payouts, date_col, platform_options, category_options, error = load_data()
 
 if error:
     st.error(f"❌ {error}")
-    st.info("Please ensure all CSV files (influencers.csv, posts.csv, tracking_data.csv, payouts.csv) are in the same directory as this script.")
+    st.info("Please ensure all data files (influencers, tracking_data, payouts as .csv or converted .parquet) are in the same directory as this script.")
     st.stop()
 
 # Title and description
@@ -44,7 +329,6 @@ st.sidebar.header("🔍 Filter Options")
 
 # Platform filter
 if "platform" in influencers.columns:
-    platform_options = influencers["platform"].dropna().unique()
     platform_filter = st.sidebar.multiselect(
         "Select Platforms:",
         platform_options,
@@ -56,7 +340,6 @@ else:
 
 # Category filter
 if "category" in influencers.columns:
-    category_options = influencers["category"].dropna().unique()
     category_filter = st.sidebar.multiselect(
         "Select Categories:",
         category_options,
@@ -67,9 +350,8 @@ else:
     st.sidebar.warning("No 'category' column found in influencers data")
 
 # Date range filter if tracking data has dates
-if "date" in tracking.columns or "campaign_date" in tracking.columns:
-    date_col = "date" if "date" in tracking.columns else "campaign_date"
-    tracking[date_col] = pd.to_datetime(tracking[date_col], errors='coerce')
+date_range = ()
+if date_col:
     date_range = st.sidebar.date_input(
         "Select Date Range:",
         value=(tracking[date_col].min(), tracking[date_col].max()),
@@ -78,250 +360,179 @@ if "date" in tracking.columns or "campaign_date" in tracking.columns:
     )
 
 # Apply filters
-filtered_influencers = influencers.copy()
+# Cached helpers below are keyed on these hashable selections rather than on DataFrames
+filter_key = (tuple(platform_filter), tuple(category_filter), tuple(date_range))
+filtered_influencers = filter_influencers(*filter_key[:2])
+name_col = get_name_col(influencers)
 
-if platform_filter and "platform" in influencers.columns:
-    filtered_influencers = filtered_influencers[
-        filtered_influencers["platform"].isin(platform_filter)
-    ]
-
-if category_filter and "category" in influencers.columns:
-    filtered_influencers = filtered_influencers[
-        filtered_influencers["category"].isin(category_filter)
-    ]
+# Section navigation: st.tabs would still execute every tab body on each rerun,
+# so a radio selector is used and only the selected section below runs
+section = st.radio(
+    "Section",
+    ["Overview", "Performance", "Revenue", "Payouts", "Export"],
+    horizontal=True,
+    label_visibility="collapsed"
+)
+has_sales = "revenue" in tracking.columns and "orders" in tracking.columns
 
 # Main dashboard layout
-col1, col2, col3, col4 = st.columns(4)
+if section == "Overview":
+    col1, col2, col3, col4 = st.columns(4)
 
-# Key metrics
-with col1:
-    total_influencers = len(filtered_influencers)
-    st.metric("Total Influencers", total_influencers)
+    # Key metrics
+    with col1:
+        total_influencers = len(filtered_influencers)
+        st.metric("Total Influencers", total_influencers)
 
-with col2:
-    if "follower_count" in filtered_influencers.columns:
-        total_reach = filtered_influencers["follower_count"].sum()
-        st.metric("Total Reach", f"{total_reach:,}")
-    else:
-        st.metric("Total Reach", "N/A")
+    with col2:
+        if "follower_count" in filtered_influencers.columns:
+            total_reach = filtered_influencers["follower_count"].sum()
+            st.metric("Total Reach", f"{total_reach:,}")
+        else:
+            st.metric("Total Reach", "N/A")
 
-with col3:
-    total_revenue = tracking["revenue"].sum() if "revenue" in tracking.columns else 0
-    st.metric("Total Revenue", f"₹{total_revenue:,.0f}")
+    # Only the KPIs read raw tracking rows; the summaries filter dates inside their cache
+    tracking_in_range = filter_tracking_dates(tracking, date_col, date_range)
 
-with col4:
-    total_orders = tracking["orders"].sum() if "orders" in tracking.columns else 0
-    st.metric("Total Orders", f"{total_orders:,}")
+    with col3:
+        total_revenue = tracking_in_range["revenue"].sum() if "revenue" in tracking.columns else 0
+        st.metric("Total Revenue", f"₹{total_revenue:,.0f}")
 
-# Top Influencers Section
-st.header("🌟 Top Influencers")
+    with col4:
+        total_orders = tracking_in_range["orders"].sum() if "orders" in tracking.columns else 0
+        st.metric("Total Orders", f"{total_orders:,}")
 
-if "follower_count" in filtered_influencers.columns:
-    top_influencers = filtered_influencers.sort_values(
-        by="follower_count", 
-        ascending=False
-    ).head(10)
-    
-    # Display as cards
-    cols = st.columns(2)
-    for idx, (_, influencer) in enumerate(top_influencers.iterrows()):
-        with cols[idx % 2]:
-            with st.container():
-                st.subheader(f"@{influencer.get('username', influencer.get('name', 'Unknown'))}")
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    st.write(f"**Platform:** {influencer.get('platform', 'N/A')}")
-                    st.write(f"**Category:** {influencer.get('category', 'N/A')}")
-                with col_b:
-                    st.write(f"**Followers:** {influencer.get('follower_count', 0):,}")
-                    if 'engagement_rate' in influencer:
-                        st.write(f"**Engagement:** {influencer['engagement_rate']:.2%}")
-else:
-    st.dataframe(filtered_influencers.head(10))
+    # Top Influencers Section
+    st.header("🌟 Top Influencers")
 
-# Performance Analysis
-st.header("📈 Campaign Performance Analysis")
-
-# Merge data for analysis
-try:
-    merged = tracking.merge(
-        influencers, 
-        on="influencer_id", 
-        how="left"
-    )
+    if "follower_count" in filtered_influencers.columns:
+        # Partial sort: only the top 10 need ordering
+        top_influencers = filtered_influencers.nlargest(10, "follower_count")
     
-    if not posts.empty:
-        merged = merged.merge(
-            posts, 
-            on="influencer_id", 
-            how="left", 
-            suffixes=("_tracking", "_post")
+        # Build card titles column-wise instead of per row
+        top_influencers = top_influencers.assign(
+            display="@" + (top_influencers[name_col].astype(str) if name_col else "Unknown")
         )
     
-    # ROAS Calculation with error handling
-    if "revenue" in merged.columns and "orders" in merged.columns:
-        # Avoid division by zero
-        merged["cost"] = merged["orders"] * 100  # Assuming cost per order is 100
-        merged["ROAS"] = np.where(
-            merged["cost"] > 0, 
-            merged["revenue"] / merged["cost"], 
-            0
-        )
+        # Display as cards: one markdown block per column instead of a widget per field
+        cards = [influencer_card_md(influencer) for influencer in top_influencers.itertuples(index=False)]
+        cols = st.columns(2)
+        for idx, col in enumerate(cols):
+            with col:
+                st.markdown("\n\n".join(cards[idx::2]))
+    else:
+        st.dataframe(filtered_influencers.head(10))
+
+# Performance Analysis
+if section == "Performance":
+    st.header("📈 Campaign Performance Analysis")
+
+    try:
+        if has_sales:
+            roas_summary = compute_roas_summary(*filter_key)
+            top_roas = roas_summary.nlargest(10, "ROAS")
         
-        # ROAS Summary
-        if not merged.empty:
-            roas_summary = merged.groupby("influencer_id").agg({
-                "ROAS": "mean",
-                "revenue": "sum",
-                "orders": "sum"
-            }).reset_index()
-            
-            # Merge with influencer names
-            if "username" in influencers.columns or "name" in influencers.columns:
-                name_col = "username" if "username" in influencers.columns else "name"
-                roas_summary = roas_summary.merge(
-                    influencers[["influencer_id", name_col]], 
-                    on="influencer_id"
-                )
-            
-            roas_summary = roas_summary.sort_values(by="ROAS", ascending=False)
-            
-            # Display top performers
-            st.subheader("🏆 Top Performing Campaigns (by ROAS)")
+            # ROAS Summary
+            if not roas_summary.empty:
+                # Display top performers
+                st.subheader("🏆 Top Performing Campaigns (by ROAS)")
             
-            # Create visualization
-            if len(roas_summary) > 0:
-                fig = px.bar(
-                    roas_summary.head(10),
-                    y=name_col if name_col in roas_summary.columns else "influencer_id",
-                    x="ROAS",
-                    title="Top 10 Influencers by ROAS",
-                    orientation="h"
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                # Create visualization
+                if len(roas_summary) > 0:
+                    fig = pio.from_json(build_roas_fig(
+                        top_roas,
+                        name_col if name_col in top_roas.columns else "influencer_id"
+                    ))
+                    st.plotly_chart(fig, use_container_width=True)
             
-            st.dataframe(roas_summary.head(10))
+                st.dataframe(top_roas)
+            else:
+                st.warning("No data available for ROAS calculation")
         else:
-            st.warning("No data available for ROAS calculation")
-    else:
-        st.warning("Revenue or orders data not available for ROAS calculation")
+            st.warning("Revenue or orders data not available for ROAS calculation")
         
-except Exception as e:
-    st.error(f"Error in performance analysis: {str(e)}")
+    except Exception as e:
+        st.error(f"Error in performance analysis: {str(e)}")
 
 # Revenue and Orders Summary
-st.header("📦 Revenue and Orders Summary")
+if section == "Revenue":
+    st.header("📦 Revenue and Orders Summary")
 
-if "revenue" in tracking.columns and "orders" in tracking.columns:
-    campaign_summary = tracking.groupby("influencer_id").agg({
-        "orders": "sum",
-        "revenue": "sum"
-    }).reset_index()
-    
-    # Add influencer names if available
-    if "username" in influencers.columns or "name" in influencers.columns:
-        name_col = "username" if "username" in influencers.columns else "name"
-        campaign_summary = campaign_summary.merge(
-            influencers[["influencer_id", name_col]], 
-            on="influencer_id",
-            how="left"
-        )
-    
-    campaign_summary = campaign_summary.sort_values(by="revenue", ascending=False)
+    try:
+        if has_sales:
+            campaign_summary = compute_campaign_summary(*filter_key)
+            top_campaigns = campaign_summary.nlargest(10, "revenue")
     
-    # Revenue distribution chart
-    if len(campaign_summary) > 0:
-        col1, col2 = st.columns(2)
+            # Revenue distribution chart
+            if len(campaign_summary) > 0:
+                col1, col2 = st.columns(2)
         
-        with col1:
-            fig_revenue = px.pie(
-                campaign_summary.head(10),
-                values="revenue",
-                names=name_col if name_col in campaign_summary.columns else "influencer_id",
-                title="Revenue Distribution (Top 10)"
-            )
-            st.plotly_chart(fig_revenue, use_container_width=True)
+                with col1:
+                    fig_revenue = pio.from_json(build_revenue_fig(
+                        top_campaigns,
+                        name_col if name_col in top_campaigns.columns else "influencer_id"
+                    ))
+                    st.plotly_chart(fig_revenue, use_container_width=True)
         
-        with col2:
-            fig_orders = px.bar(
-                campaign_summary.head(10),
-                x=name_col if name_col in campaign_summary.columns else "influencer_id",
-                y="orders",
-                title="Orders by Influencer (Top 10)"
-            )
-            fig_orders.update_xaxes(tickangle=45)
-            st.plotly_chart(fig_orders, use_container_width=True)
+                with col2:
+                    fig_orders = pio.from_json(build_orders_fig(
+                        top_campaigns,
+                        name_col if name_col in top_campaigns.columns else "influencer_id"
+                    ))
+                    st.plotly_chart(fig_orders, use_container_width=True)
     
-    st.dataframe(campaign_summary.head(10))
-else:
-    st.warning("Revenue or orders data not available")
+            st.dataframe(top_campaigns)
+        else:
+            st.warning("Revenue or orders data not available")
+
+    except Exception as e:
+        st.error(f"Error in revenue summary: {str(e)}")
 
 # Payout Tracking
-st.header("💰 Payout Tracking")
+if section == "Payouts":
+    st.header("💰 Payout Tracking")
 
-if not payouts.empty:
-    # Payout summary with status
-    payout_summary = payouts.sort_values(by="total_payout", ascending=False)
+    if not payouts.empty:
+        # Payout summary with status
+        payout_summary = payouts.sort_values(by="total_payout", ascending=False)
     
-    # Add status indicators
-    if "status" in payouts.columns:
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            status_counts = payouts["status"].value_counts()
-            fig_status = px.pie(
-                values=status_counts.values,
-                names=status_counts.index,
-                title="Payout Status Distribution"
+        # Add status indicators
+        if "status" in payouts.columns:
+            # One pass over payouts for both the status counts and the per-status totals
+            by_status = payouts.groupby("status", observed=True, sort=False)["total_payout"].agg(
+                count="size",
+                total="sum"
             )
-            st.plotly_chart(fig_status, use_container_width=True)
+            col1, col2 = st.columns(2)
         
-        with col2:
-            pending_amount = payouts[payouts["status"] == "pending"]["total_payout"].sum()
-            paid_amount = payouts[payouts["status"] == "paid"]["total_payout"].sum()
+            with col1:
+                fig_status = pio.from_json(build_status_fig(by_status["count"]))
+                st.plotly_chart(fig_status, use_container_width=True)
+        
+            with col2:
+                pending_amount = by_status["total"].get("pending", 0)
+                paid_amount = by_status["total"].get("paid", 0)
             
-            st.metric("Pending Payouts", f"₹{pending_amount:,.0f}")
-            st.metric("Paid Amount", f"₹{paid_amount:,.0f}")
+                st.metric("Pending Payouts", f"₹{pending_amount:,.0f}")
+                st.metric("Paid Amount", f"₹{paid_amount:,.0f}")
     
-    st.dataframe(payout_summary)
-else:
-    st.warning("No payout data available")
+        st.dataframe(payout_summary)
+    else:
+        st.warning("No payout data available")
 
 # Export Section
-st.header("📥 Export Data")
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    if 'roas_summary' in locals() and not roas_summary.empty:
-        csv_roas = roas_summary.to_csv(index=False)
-        st.download_button(
-            "📊 Download ROAS Summary",
-            csv_roas,
-            "roas_summary.csv",
-            "text/csv"
-        )
-
-with col2:
-    if not payouts.empty:
-        csv_payouts = payouts.to_csv(index=False)
-        st.download_button(
-            "💰 Download Payouts",
-            csv_payouts,
-            "payouts.csv",
-            "text/csv"
-        )
+if section == "Export":
+    st.header("📥 Export Data")
 
-with col3:
-    if 'campaign_summary' in locals() and not campaign_summary.empty:
-        csv_campaign = campaign_summary.to_csv(index=False)
-        st.download_button(
-            "📦 Download Campaign Summary",
-            csv_campaign,
-            "campaign_summary.csv",
-            "text/csv"
+    # Summaries come from the cache, so Export doesn't depend on the other sections running
+    try:
+        render_export(
+            compute_roas_summary(*filter_key) if has_sales else None,
+            compute_campaign_summary(*filter_key) if has_sales else None,
+            payouts
         )
+    except Exception as e:
+        st.error(f"Error preparing exports: {str(e)}")
 
 # Footer
 st.markdown("---")